@@ -53,10 +53,26 @@ def on_collection_prefix_changed(self, context):
         if not self.selected_collection.startswith(self.collection_prefix):
             self.selected_collection = ""
 
-    # Force panel redraw
-    for area in context.screen.areas:
-        if area.type == 'VIEW_3D':
-            area.tag_redraw()
+    # Redraw the panel's own area; the prefix is edited from the sidebar.
+    # Throttled so rapid edits coalesce into one redraw.
+    panel.request_redraw(context.area)
+
+
+def on_framing_changed(self, context):
+    """
+    Callback when scale or padding changes.
+    Lets the panel hold its collection info steady during slider drags.
+    """
+    panel.note_framing_changed(context.area)
+
+
+# Static enum items kept at module scope so Blender always holds references
+# to the same strings
+_OVERWRITE_ITEMS = (
+    ('OVERWRITE', "Overwrite", "Replace existing file"),
+    ('SKIP', "Skip", "Skip rendering if file exists"),
+    ('INCREMENT', "Auto-number", "Add number suffix (_001, _002, etc.)"),
+)
 
 
 class ScaleRenderProperties(PropertyGroup):
@@ -69,6 +85,7 @@ class ScaleRenderProperties(PropertyGroup):
         min=0.1,
         max=100.0,
         precision=1,
+        update=on_framing_changed,
     )
 
     padding_px: IntProperty(
@@ -77,6 +94,7 @@ class ScaleRenderProperties(PropertyGroup):
         default=10,
         min=0,
         max=500,
+        update=on_framing_changed,
     )
 
     output_folder: StringProperty(
@@ -96,11 +114,7 @@ class ScaleRenderProperties(PropertyGroup):
     overwrite_mode: EnumProperty(
         name="If File Exists",
         description="What to do when output file already exists",
-        items=[
-            ('OVERWRITE', "Overwrite", "Replace existing file"),
-            ('SKIP', "Skip", "Skip rendering if file exists"),
-            ('INCREMENT', "Auto-number", "Add number suffix (_001, _002, etc.)"),
-        ],
+        items=_OVERWRITE_ITEMS,
         default='OVERWRITE',
     )
 
@@ -112,6 +126,16 @@ class ScaleRenderProperties(PropertyGroup):
         default="",
     )
 
+
+
+class ScaleRenderRuntime(PropertyGroup):
+    """
+    Runtime state for Scale Render (not saved, no undo steps).
+
+    Stored on the WindowManager rather than the Scene so writing the
+    evaluation cache doesn't push undo steps or grow the .blend file.
+    """
+
     # Cache for last evaluated collection (internal use)
     last_evaluated_collection: StringProperty(
         name="Last Evaluated Collection",
@@ -129,6 +153,7 @@ class ScaleRenderProperties(PropertyGroup):
 # Registration
 classes = (
     ScaleRenderProperties,
+    ScaleRenderRuntime,
 )
 
 
@@ -137,10 +162,12 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     
-    # Add properties to scene
+    # Add properties to scene, runtime state to window manager
     bpy.types.Scene.scale_render_props = PointerProperty(type=ScaleRenderProperties)
+    bpy.types.WindowManager.scale_render_runtime = PointerProperty(type=ScaleRenderRuntime)
     
     # Register submodules
+    core.register()
     operators.register()
     panel.register()
     
@@ -151,8 +178,10 @@ def unregister():
     # Unregister submodules
     panel.unregister()
     operators.unregister()
+    core.unregister()
     
     # Remove properties
+    del bpy.types.WindowManager.scale_render_runtime
     del bpy.types.Scene.scale_render_props
     
     # Unregister property group
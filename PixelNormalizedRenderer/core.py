@@ -3,10 +3,22 @@ Core utilities for Scale Render Addon
 Camera math, resolution calculation, collection handling
 """
 
+import bisect
 import bpy
+import functools
+import logging
 import math
+import numpy as np
+from contextlib import contextmanager
+from dataclasses import dataclass
+from bpy.app.handlers import persistent
 from mathutils import Vector
-from typing import Tuple, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# Camera math debug output, silent unless enabled, e.g. from Blender's
+# Python console: logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
 
 
 # Constants
@@ -15,46 +27,141 @@ SENSOR_WIDTH = 36.0  # mm, full frame
 ELEVATION_ANGLE = math.radians(12)  # 12 degrees downward
 MAX_RESOLUTION = 16384  # Maximum output resolution (common GPU texture limit)
 
+# Camera trig derived from the fixed lens and elevation, computed once at import
+TAN_HALF_FOV_H = SENSOR_WIDTH / (2 * FOCAL_LENGTH)  # Pinhole: half sensor / focal
+HALF_FOV_H = math.atan(TAN_HALF_FOV_H)  # Horizontal half-FOV
+COS_ELEV = math.cos(ELEVATION_ANGLE)
+SIN_ELEV = math.sin(ELEVATION_ANGLE)
+TAN_ELEV = math.tan(ELEVATION_ANGLE)
+CAMERA_ROTATION = (math.pi / 2 - ELEVATION_ANGLE, 0.0, 0.0)  # Euler XYZ, no roll
+
+
+# Below this many objects the NumPy setup cost outweighs the batched transform
+NUMPY_MIN_OBJECTS = 4
 
-def get_object_dimensions(obj: bpy.types.Object) -> Tuple[float, float, float]:
+
+def _corner_bounds(objects: List[bpy.types.Object]) -> Tuple[Vector, Vector]:
     """
-    Get world-space bounding box dimensions of an object in millimeters.
+    Scalar single-pass min/max over the world-space bound_box corners.
+
+    Tracks six running extremes instead of building per-axis lists, which
+    is the cheaper path for the handful of corners a single object has.
+    The extremes are seeded from the first corner, so a value below the
+    running min can skip the max test. Corners are transformed with the
+    matrix rows unpacked into floats, so no Vector is built per corner.
 
     Args:
-        obj: Blender object to measure
+        objects: Non-empty list of Blender objects
 
     Returns:
-        (width, height, depth) in millimeters, accounting for scene unit scale
+        (min_corner, max_corner) as Vectors
     """
-    # Get world-space bounding box corners
-    bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
+    xmin = None
+
+    for obj in objects:
+        # One RNA read each for the matrix and the corners per object
+        (m00, m01, m02, tx), (m10, m11, m12, ty), (m20, m21, m22, tz), _ = obj.matrix_world
+        corners = obj.bound_box
+
+        if xmin is None:
+            # Seed the extremes from the first object's first corner
+            cx, cy, cz = corners[0]
+            xmin = xmax = m00 * cx + m01 * cy + m02 * cz + tx
+            ymin = ymax = m10 * cx + m11 * cy + m12 * cz + ty
+            zmin = zmax = m20 * cx + m21 * cy + m22 * cz + tz
+
+        for cx, cy, cz in corners:
+            x = m00 * cx + m01 * cy + m02 * cz + tx
+            y = m10 * cx + m11 * cy + m12 * cz + ty
+            z = m20 * cx + m21 * cy + m22 * cz + tz
+            if x < xmin:
+                xmin = x
+            elif x > xmax:
+                xmax = x
+            if y < ymin:
+                ymin = y
+            elif y > ymax:
+                ymax = y
+            if z < zmin:
+                zmin = z
+            elif z > zmax:
+                zmax = z
+
+    return Vector((xmin, ymin, zmin)), Vector((xmax, ymax, zmax))
+
+
+def _world_bounds(objects: List[bpy.types.Object]) -> Tuple[Vector, Vector]:
+    """
+    Get the world-space axis-aligned bounds of one or more objects.
 
-    xs = [v.x for v in bbox_corners]
-    ys = [v.y for v in bbox_corners]
-    zs = [v.z for v in bbox_corners]
+    For larger inputs all bound_box corners and world matrices are
+    gathered into (N, 8, 3) and (N, 4, 4) arrays, transformed with one
+    batched multiply and reduced once. Small inputs take the scalar path.
 
-    # Get dimensions in Blender Units
-    width = max(xs) - min(xs)   # X dimension
-    depth = max(ys) - min(ys)   # Y dimension (into screen)
-    height = max(zs) - min(zs)  # Z dimension (vertical)
+    Args:
+        objects: Non-empty list of Blender objects
 
-    # Convert to millimeters using scene unit scale
-    # bpy.context.scene.unit_settings.scale_length is the multiplier
-    # If set to 0.001, then 1 BU = 1 meter = 1000mm
-    # If set to 1.0, then 1 BU = 1 meter = 1000mm (default)
-    # If set to 0.01, then 1 BU = 1 cm = 10mm
-    unit_scale = bpy.context.scene.unit_settings.scale_length
+    Returns:
+        (min_corner, max_corner) as Vectors
+    """
+    if len(objects) < NUMPY_MIN_OBJECTS:
+        return _corner_bounds(objects)
 
-    # Blender's default is: 1 BU = 1 meter when scale_length = 1.0
-    # So we need to convert: BU -> meters -> millimeters
-    meters_per_bu = unit_scale
-    mm_per_meter = 1000.0
+    count = len(objects)
+    local = np.empty((count, 8, 3), dtype=np.float64)
+    matrices = np.empty((count, 4, 4), dtype=np.float64)
 
-    width_mm = width * meters_per_bu * mm_per_meter
-    height_mm = height * meters_per_bu * mm_per_meter
-    depth_mm = depth * meters_per_bu * mm_per_meter
+    for i, obj in enumerate(objects):
+        local[i] = obj.bound_box
+        matrices[i] = obj.matrix_world
 
-    return width_mm, height_mm, depth_mm
+    # world = R @ corner + T for every corner of every object in one call
+    corners = np.einsum('nij,nkj->nki', matrices[:, :3, :3], local) + matrices[:, None, :3, 3]
+    corners = corners.reshape(-1, 3)
+
+    return Vector(corners.min(axis=0).tolist()), Vector(corners.max(axis=0).tolist())
+
+
+def get_mm_per_bu(scene: Optional[bpy.types.Scene] = None) -> float:
+    """
+    Get the millimeters per Blender Unit for a scene.
+
+    scene.unit_settings.scale_length is meters per BU (1.0 by default,
+    0.01 when 1 BU = 1 cm). Operators read this once per invocation and
+    pass it to the dimension helpers instead of re-reading it per mesh.
+
+    Args:
+        scene: Scene to read from (defaults to the context scene)
+
+    Returns:
+        Multiplier converting Blender Units to millimeters
+    """
+    if scene is None:
+        scene = bpy.context.scene
+
+    return scene.unit_settings.scale_length * 1000.0
+
+
+def get_object_dimensions(obj: bpy.types.Object, mm_per_bu: Optional[float] = None) -> Tuple[float, float, float]:
+    """
+    Get world-space bounding box dimensions of an object in millimeters.
+
+    Args:
+        obj: Blender object to measure
+        mm_per_bu: Unit conversion from get_mm_per_bu() (read from the scene if None)
+
+    Returns:
+        (width, height, depth) in millimeters, accounting for scene unit scale
+    """
+    # Get dimensions in Blender Units: X, Y (into screen), Z (vertical)
+    min_corner, max_corner = _world_bounds([obj])
+    width, depth, height = max_corner - min_corner
+
+    # Convert to millimeters using scene unit scale
+    if mm_per_bu is None:
+        mm_per_bu = get_mm_per_bu()
+
+    return width * mm_per_bu, height * mm_per_bu, depth * mm_per_bu
 
 
 def get_object_center(obj: bpy.types.Object) -> Vector:
@@ -67,19 +174,9 @@ def get_object_center(obj: bpy.types.Object) -> Vector:
     Returns:
         Center point as Vector
     """
-    bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-    
-    xs = [v.x for v in bbox_corners]
-    ys = [v.y for v in bbox_corners]
-    zs = [v.z for v in bbox_corners]
-    
-    center = Vector((
-        (max(xs) + min(xs)) / 2,
-        (max(ys) + min(ys)) / 2,
-        (max(zs) + min(zs)) / 2
-    ))
-    
-    return center
+    min_corner, max_corner = _world_bounds([obj])
+
+    return (min_corner + max_corner) / 2
 
 
 def calculate_resolution(
@@ -109,7 +206,9 @@ def calculate_resolution(
 def calculate_camera_position(
     collection: bpy.types.Collection,
     scale_factor: float,
-    padding_px: int
+    padding_px: int,
+    bounds: Optional["CollectionBounds"] = None,
+    resolution: Optional[Tuple[int, int]] = None
 ) -> Tuple[Vector, Tuple[float, float, float]]:
     """
     Calculate camera position to properly frame all objects in a collection.
@@ -124,178 +223,220 @@ def calculate_camera_position(
         collection: Blender collection containing objects to frame
         scale_factor: Pixels per mm
         padding_px: Pixels to add on each edge
+        bounds: Precomputed compute_collection_bounds() result, if available
+        resolution: Precomputed calculate_resolution() result, if available
 
     Returns:
         (location, rotation_euler) for camera
     """
     # Get bounding box corners (not just dimensions)
-    min_corner, max_corner, mesh_objects = get_collection_bounds(collection)
+    if bounds is None:
+        bounds = compute_collection_bounds(collection)
 
-    if min_corner is None:
+    if bounds is None:
         # Fallback to origin if no valid objects
         return Vector((0, -1, 0.5)), (math.radians(78), 0, 0)
 
-    center = get_collection_center(collection)
-    width, height, depth = get_collection_dimensions(collection)
+    min_corner = bounds.min_corner
+    max_corner = bounds.max_corner
+    center = bounds.center
+    width, height, depth = bounds.width_mm, bounds.height_mm, bounds.depth_mm
 
-    print(f"DEBUG core.py: width={width}mm, height={height}mm, depth={depth}mm")
-    print(f"DEBUG core.py: min_corner={min_corner}, max_corner={max_corner}")
-    print(f"DEBUG core.py: center={center}")
+    log.debug("width=%smm, height=%smm, depth=%smm", width, height, depth)
+    log.debug("min_corner=%s, max_corner=%s", min_corner, max_corner)
+    log.debug("center=%s", center)
 
     # Calculate padding in Blender Units
-    unit_scale = bpy.context.scene.unit_settings.scale_length
-    meters_per_bu = unit_scale
-    mm_per_meter = 1000.0
     padding_mm = padding_px / scale_factor
-    padding_bu = padding_mm / mm_per_meter / meters_per_bu
-
-    # Calculate FOV from focal length (85mm lens on 36mm sensor)
-    # This is the HALF angle for easier math
-    half_fov_h = math.atan(SENSOR_WIDTH / (2 * FOCAL_LENGTH))
+    padding_bu = padding_mm / bounds.mm_per_bu
 
     # Calculate aspect ratio of our output
-    res_w, res_h = calculate_resolution(width, height, scale_factor, padding_px)
+    if resolution is None:
+        resolution = calculate_resolution(width, height, scale_factor, padding_px)
+    res_w, res_h = resolution
     aspect = res_w / res_h
 
-    # Vertical half-FOV based on horizontal FOV and aspect
-    half_fov_v = math.atan(math.tan(half_fov_h) / aspect)
-
-    print(f"DEBUG core.py: half_fov_h={math.degrees(half_fov_h):.2f}°, half_fov_v={math.degrees(half_fov_v):.2f}°")
-    print(f"DEBUG core.py: aspect={aspect:.4f}, res={res_w}x{res_h}")
-
-    # Generate all 8 corners of the bounding box (with padding)
-    bbox_corners = [
-        Vector((min_corner.x - padding_bu, min_corner.y, min_corner.z - padding_bu)),  # front-bottom-left
-        Vector((max_corner.x + padding_bu, min_corner.y, min_corner.z - padding_bu)),  # front-bottom-right
-        Vector((min_corner.x - padding_bu, min_corner.y, max_corner.z + padding_bu)),  # front-top-left
-        Vector((max_corner.x + padding_bu, min_corner.y, max_corner.z + padding_bu)),  # front-top-right
-        Vector((min_corner.x - padding_bu, max_corner.y, min_corner.z - padding_bu)),  # back-bottom-left
-        Vector((max_corner.x + padding_bu, max_corner.y, min_corner.z - padding_bu)),  # back-bottom-right
-        Vector((min_corner.x - padding_bu, max_corner.y, max_corner.z + padding_bu)),  # back-top-left
-        Vector((max_corner.x + padding_bu, max_corner.y, max_corner.z + padding_bu)),  # back-top-right
-    ]
+    # Half-FOV tangents (85mm lens on 36mm sensor); the fit below only
+    # needs tangents, so the vertical angle itself is never computed
+    tan_half_fov_v = TAN_HALF_FOV_H / aspect
 
-    # We need to find a camera distance such that ALL corners fit in view
-    # The camera is positioned along the -Y axis from the center, elevated by ELEVATION_ANGLE
-    #
-    # For each corner, we need to ensure it's within the frustum.
-    # We'll use an iterative approach: start with an estimate and verify all corners fit.
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("half_fov_h=%.2f°, half_fov_v=%.2f°",
+                  math.degrees(HALF_FOV_H), math.degrees(math.atan(tan_half_fov_v)))
+    log.debug("aspect=%.4f, res=%dx%d", aspect, res_w, res_h)
 
-    # Initial estimate: use the simple perpendicular calculation
+    # Padded bounding box extents; the 8 corners are every combination
+    xs = np.array((min_corner.x - padding_bu, max_corner.x + padding_bu))
+    ys = np.array((min_corner.y, max_corner.y))
+    zs = np.array((min_corner.z - padding_bu, max_corner.z + padding_bu))
+    corner_x, corner_y, corner_z = (a.ravel() for a in np.meshgrid(xs, ys, zs, indexing='ij'))
+
+    # Lower bound: the simple perpendicular fit of the front face
     frame_width_bu = (max_corner.x - min_corner.x) + (padding_bu * 2)
     frame_height_bu = (max_corner.z - min_corner.z) + (padding_bu * 2)
 
-    dist_for_width = (frame_width_bu / 2) / math.tan(half_fov_h)
-    dist_for_height = (frame_height_bu / 2) / math.tan(half_fov_v)
-    camera_distance = max(dist_for_width, dist_for_height)
+    dist_for_width = (frame_width_bu / 2) / TAN_HALF_FOV_H
+    dist_for_height = (frame_height_bu / 2) / tan_half_fov_v
 
     # Account for object depth - camera needs to see the front face
-    # The front of the object is at min_corner.y, so distance should be from there
+    # The front of the object is at min_corner.y, so distance is measured from there
     object_front_y = min_corner.y
 
-    # Iteratively increase distance until all corners fit
-    # We check if each corner projects within the FOV angles
-    max_iterations = 20
-    for iteration in range(max_iterations):
-        # Calculate camera position for this distance
-        # Camera is at center.x, (object_front - distance), (center.z + elevation_offset)
-        cam_x = center.x
-        cam_y = object_front_y - camera_distance
-        cam_z = center.z + (camera_distance * math.tan(ELEVATION_ANGLE))
-
-        cam_location = Vector((cam_x, cam_y, cam_z))
-
-        # Calculate the direction the camera is pointing (toward center)
-        look_direction = (center - cam_location).normalized()
-
-        # Check if all corners are within the frustum
-        all_corners_visible = True
-        max_h_angle = 0
-        max_v_angle = 0
-
-        for corner in bbox_corners:
-            # Vector from camera to this corner
-            to_corner = corner - cam_location
-
-            # Project onto camera's local coordinate system
-            # Camera looks along -Z (which is our look_direction)
-            # Camera's local X is world X (horizontal)
-            # Camera's local Y is perpendicular to look direction in the XZ plane
-
-            # Distance along the look direction
-            forward_dist = to_corner.dot(look_direction)
-
-            if forward_dist <= 0:
-                # Corner is behind the camera - definitely need more distance
-                all_corners_visible = False
-                break
-
-            # Horizontal offset (X axis)
-            horizontal_offset = corner.x - cam_x
-
-            # Vertical offset - need to account for camera tilt
-            # The camera is tilted down by ELEVATION_ANGLE
-            # So "up" in camera space is rotated
-            # Vertical offset in camera space is approximately:
-            vertical_offset = (corner.z - cam_z) * math.cos(ELEVATION_ANGLE) + \
-                              (corner.y - cam_y) * math.sin(ELEVATION_ANGLE)
-
-            # Calculate angles
-            h_angle = abs(math.atan2(horizontal_offset, forward_dist))
-            v_angle = abs(math.atan2(vertical_offset, forward_dist))
-
-            max_h_angle = max(max_h_angle, h_angle)
-            max_v_angle = max(max_v_angle, v_angle)
-
-            # Check if within FOV (with small margin)
-            if h_angle > half_fov_h * 0.98 or v_angle > half_fov_v * 0.98:
-                all_corners_visible = False
-
-        if all_corners_visible:
-            print(f"DEBUG core.py: Iteration {iteration}: All corners visible at distance {camera_distance:.4f}")
-            print(f"DEBUG core.py: max_h_angle={math.degrees(max_h_angle):.2f}° (limit {math.degrees(half_fov_h):.2f}°)")
-            print(f"DEBUG core.py: max_v_angle={math.degrees(max_v_angle):.2f}° (limit {math.degrees(half_fov_v):.2f}°)")
-            break
-        else:
-            # Increase distance by 10%
-            camera_distance *= 1.10
-            print(f"DEBUG core.py: Iteration {iteration}: Increasing distance to {camera_distance:.4f}")
+    # Solve for the smallest distance d that keeps every corner in view.
+    # The camera sits at (center.x, front_y - d, center.z + d*tan(E)) tilted
+    # down by E. For a corner offset (dx, dy, dz) from (center.x, front_y,
+    # center.z), in camera space:
+    #   forward(d) = dy*cos(E) - dz*sin(E) + d/cos(E)
+    #   vertical   = dz*cos(E) + dy*sin(E)        (independent of d)
+    #   horizontal = dx
+    # Fitting |horizontal| <= tan(half_fov_h) * forward and
+    # |vertical| <= tan(half_fov_v) * forward is linear in d per corner.
+    dx = corner_x - center.x
+    dy = corner_y - object_front_y
+    dz = corner_z - center.z
+
+    forward_at_zero = dy * COS_ELEV - dz * SIN_ELEV
+    vertical = dz * COS_ELEV + dy * SIN_ELEV
+
+    d_for_h = (np.abs(dx) / TAN_HALF_FOV_H - forward_at_zero) * COS_ELEV
+    d_for_v = (np.abs(vertical) / tan_half_fov_v - forward_at_zero) * COS_ELEV
+
+    camera_distance = max(dist_for_width, dist_for_height, float(d_for_h.max()), float(d_for_v.max()))
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("perpendicular fit=%.4f, corner fit h=%.4f v=%.4f",
+                  max(dist_for_width, dist_for_height), d_for_h.max(), d_for_v.max())
 
     # Add safety buffer
     camera_distance *= 1.05
 
+    if log.isEnabledFor(logging.DEBUG):
+        # Every padded corner must land inside the frustum at the final distance
+        forward = forward_at_zero + camera_distance / COS_ELEV
+        outside = ((np.abs(dx) > TAN_HALF_FOV_H * forward) |
+                   (np.abs(vertical) > tan_half_fov_v * forward))
+        if outside.any():
+            log.warning("%d padded corner(s) fall outside the camera frame", int(outside.sum()))
+
     # Final camera position
     cam_x = center.x
     cam_y = object_front_y - camera_distance
-    cam_z = center.z + (camera_distance * math.tan(ELEVATION_ANGLE))
+    cam_z = center.z + (camera_distance * TAN_ELEV)
 
     location = Vector((cam_x, cam_y, cam_z))
 
-    print(f"DEBUG core.py: FINAL camera_distance={camera_distance:.4f}")
-    print(f"DEBUG core.py: ELEVATION_ANGLE={math.degrees(ELEVATION_ANGLE):.2f}°")
-    print(f"DEBUG core.py: location={location}")
-    print(f"DEBUG core.py: actual distance to center={(location - center).length:.4f}")
-
-    # Calculate rotation to point camera at object center
-    # Blender cameras look down their local -Z axis
-    direction = center - location
-    print(f"DEBUG core.py: direction={direction}")
-    direction.normalize()
-    print(f"DEBUG core.py: direction (normalized)={direction}")
+    log.debug("FINAL camera_distance=%.4f", camera_distance)
+    log.debug("location=%s", location)
 
-    # Create rotation quaternion to point -Z at the target
-    # Use 'Y' as up vector to keep camera upright
-    quat = direction.to_track_quat('-Z', 'Y')
-    rotation = quat.to_euler('XYZ')
+    # Blender cameras look down their local -Z axis; X rotation of 90°
+    # faces +Y. The fit above is solved for a pure downward tilt of
+    # ELEVATION_ANGLE about X, so the rotation is a fixed constant
+    rotation = CAMERA_ROTATION
 
-    print(f"DEBUG core.py: rotation (deg)=X:{math.degrees(rotation.x):.2f}° Y:{math.degrees(rotation.y):.2f}° Z:{math.degrees(rotation.z):.2f}°")
+    log.debug("rotation=%s", rotation)
 
     return location, rotation
 
 
+# Index of non-empty collection names matching recently drawn prefixes.
+# Kept up to date by _update_prefix_index() as collections change, and
+# cleared wholesale on undo/redo/load or when collections are removed.
+# Only the panel reads it; operators always scan via scan_filtered_collections().
+_prefix_index: Dict[str, Set[str]] = {}
+_PREFIX_INDEX_SIZE = 8  # typing a prefix indexes every partial prefix
+_indexed_count = 0
+
+# Lookup for prefixes not yet in _prefix_index: all collection names kept
+# sorted so a prefix maps to one contiguous bisect range, plus the set of
+# names with any objects.
+_sorted_names: List[str] = []
+_non_empty: Set[str] = set()
+
+# Sorts after any character a collection name can contain
+_PREFIX_END = "\U0010ffff"
+
+
+def _reset_name_index():
+    """Forget all indexed collection names so the next lookup rebuilds them."""
+    _prefix_index.clear()
+    _sorted_names.clear()
+    _non_empty.clear()
+
+
+def _build_name_index():
+    """Collect and sort every collection name in one scan."""
+    # Bound-method aliases keep attribute lookups out of the loop
+    append_name = _sorted_names.append
+    add_non_empty = _non_empty.add
+
+    for coll in bpy.data.collections:
+        name = coll.name
+        append_name(name)
+        if coll.objects:
+            add_non_empty(name)
+
+    _sorted_names.sort()
+
+
+def _names_with_prefix(prefix: str) -> List[str]:
+    """Get indexed names starting with prefix via two binary searches."""
+    lo = bisect.bisect_left(_sorted_names, prefix)
+    hi = bisect.bisect_right(_sorted_names, prefix + _PREFIX_END, lo)
+    return _sorted_names[lo:hi]
+
+
+@persistent
+def _clear_caches(*args):
+    """Drop cached collection data after undo, redo or file load."""
+    _reset_name_index()
+    _bounds_cache.clear()
+
+
+@persistent
+def _update_prefix_index(scene, depsgraph):
+    """Add or drop updated collections from every indexed prefix."""
+    if not _sorted_names or not depsgraph.id_type_updated('COLLECTION'):
+        return
+
+    for update in depsgraph.updates:
+        if not isinstance(update.id, bpy.types.Collection):
+            continue
+
+        coll = bpy.data.collections.get(update.id.name)
+        if coll is None:
+            continue
+
+        name = coll.name
+        non_empty = bool(coll.objects)
+
+        i = bisect.bisect_left(_sorted_names, name)
+        if i == len(_sorted_names) or _sorted_names[i] != name:
+            _sorted_names.insert(i, name)
+
+        if non_empty:
+            _non_empty.add(name)
+        else:
+            _non_empty.discard(name)
+
+        for prefix, names in _prefix_index.items():
+            if non_empty and name[:len(prefix)] == prefix:
+                names.add(name)
+            else:
+                names.discard(name)
+
+
 def get_filtered_collections(prefix: str) -> List[bpy.types.Collection]:
     """
-    Get all collections matching the given prefix.
+    Get all collections matching the given prefix, for panel drawing.
+
+    Matching names are indexed per prefix and maintained incrementally,
+    so panel redraws are a dict lookup rather than a rescan of
+    bpy.data.collections. A new prefix is a binary search over the sorted
+    collection names. Results are ordered by name.
+
+    The index can briefly lag renames or objects added without a depsgraph
+    update; anything that acts on the result should call
+    scan_filtered_collections() instead.
 
     Args:
         prefix: String prefix to match (e.g., "RENDER_")
@@ -304,35 +445,62 @@ def get_filtered_collections(prefix: str) -> List[bpy.types.Collection]:
     Returns:
         List of collection objects
     """
-    collections = []
-    
-    for coll in bpy.data.collections:
-        if prefix == "" or coll.name.startswith(prefix):
-            # Skip empty collections
-            if len(coll.objects) > 0:
-                collections.append(coll)
-    
+    global _indexed_count
+
+    # Removed collections never show up in depsgraph updates
+    if len(bpy.data.collections) != _indexed_count:
+        _reset_name_index()
+        _indexed_count = len(bpy.data.collections)
+
+    names = _prefix_index.get(prefix)
+
+    if names is not None:
+        collections = [bpy.data.collections.get(name) for name in sorted(names)]
+        # A renamed collection means the index is stale
+        if None not in collections:
+            return collections
+        _reset_name_index()
+
+    if not _sorted_names:
+        _build_name_index()
+
+    non_empty = _non_empty
+    names = [name for name in _names_with_prefix(prefix) if name in non_empty]
+
+    # Drop names left behind by renamed collections
+    collections = [bpy.data.collections.get(name) for name in names]
+    collections = [coll for coll in collections if coll is not None]
+
+    if len(_prefix_index) >= _PREFIX_INDEX_SIZE:
+        _prefix_index.clear()
+    _prefix_index[prefix] = {coll.name for coll in collections}
+
     return collections
 
 
-def get_collection_bounds(collection: bpy.types.Collection) -> Tuple[Vector, Vector, List[bpy.types.Object]]:
+def scan_filtered_collections(prefix: str) -> List[bpy.types.Collection]:
     """
-    Get the combined bounding box of all mesh objects in a collection.
+    Get all collections matching the given prefix from a fresh scan.
 
-    This treats all meshes in the collection as a single composite object,
-    which is the correct approach when a product is made from multiple parts.
+    Unlike get_filtered_collections() this never uses the name index, so
+    operators always see the current collection names and contents.
 
     Args:
-        collection: Collection to analyze
+        prefix: String prefix to match (e.g., "RENDER_")
+                Empty string matches all collections.
 
     Returns:
-        (min_corner, max_corner, mesh_objects) tuple
-        - min_corner: Vector of minimum (x, y, z) in world space
-        - max_corner: Vector of maximum (x, y, z) in world space
-        - mesh_objects: List of mesh objects that were included
+        List of collection objects, in bpy.data.collections order
     """
+    return [
+        coll for coll in bpy.data.collections
+        if coll.name.startswith(prefix) and coll.objects
+    ]
+
+
+def _get_mesh_objects(collection: bpy.types.Collection) -> List[bpy.types.Object]:
+    """Get the mesh objects in a collection, skipping '_' prefixed helpers."""
     mesh_objects = []
-    all_corners = []
 
     for obj in collection.objects:
         # Only consider mesh objects
@@ -345,25 +513,136 @@ def get_collection_bounds(collection: bpy.types.Collection) -> Tuple[Vector, Vec
 
         mesh_objects.append(obj)
 
-        # Get world-space bounding box corners for this object
-        bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-        all_corners.extend(bbox_corners)
+    return mesh_objects
 
-    if not all_corners:
+
+def get_collection_bounds(collection: bpy.types.Collection) -> Tuple[Vector, Vector, List[bpy.types.Object]]:
+    """
+    Get the combined bounding box of all mesh objects in a collection.
+
+    This treats all meshes in the collection as a single composite object,
+    which is the correct approach when a product is made from multiple parts.
+
+    Args:
+        collection: Collection to analyze
+
+    Returns:
+        (min_corner, max_corner, mesh_objects) tuple
+        - min_corner: Vector of minimum (x, y, z) in world space
+        - max_corner: Vector of maximum (x, y, z) in world space
+        - mesh_objects: List of mesh objects that were included
+    """
+    bounds = compute_collection_bounds(collection)
+
+    if bounds is None:
         return None, None, []
 
-    # Find the overall min/max across all objects
-    xs = [v.x for v in all_corners]
-    ys = [v.y for v in all_corners]
-    zs = [v.z for v in all_corners]
+    return bounds.min_corner.copy(), bounds.max_corner.copy(), list(bounds.mesh_objects)
+
 
-    min_corner = Vector((min(xs), min(ys), min(zs)))
-    max_corner = Vector((max(xs), max(ys), max(zs)))
+@dataclass
+class CollectionBounds:
+    """Combined bounding box of a collection's meshes, computed once and shared."""
+    min_corner: Vector
+    max_corner: Vector
+    mesh_objects: List[bpy.types.Object]
+    width_mm: float
+    height_mm: float
+    depth_mm: float
+    center: Vector
+    mm_per_bu: float
 
-    return min_corner, max_corner, mesh_objects
 
+def compute_collection_bounds(
+    collection: bpy.types.Collection,
+    mm_per_bu: Optional[float] = None
+) -> Optional[CollectionBounds]:
+    """
+    Get the combined bounds of a collection's meshes with derived values.
+
+    This is the single place collection bounds are computed;
+    get_collection_bounds, get_collection_dimensions and
+    get_collection_center all derive from it. Operators should compute
+    this once and pass it to the functions that accept a ``bounds`` argument.
+
+    Args:
+        collection: Collection to analyze
+        mm_per_bu: Unit conversion from get_mm_per_bu() (read from the scene if None)
 
-def get_collection_dimensions(collection: bpy.types.Collection) -> Tuple[float, float, float]:
+    Returns:
+        CollectionBounds, or None if the collection has no valid meshes
+    """
+    mesh_objects = _get_mesh_objects(collection)
+
+    if not mesh_objects:
+        return None
+
+    if mm_per_bu is None:
+        mm_per_bu = get_mm_per_bu()
+
+    min_corner, max_corner = _world_bounds(mesh_objects)
+
+    # Convert Blender Units to millimeters using scene unit scale
+    width, depth, height = (max_corner - min_corner) * mm_per_bu
+
+    return CollectionBounds(
+        min_corner=min_corner,
+        max_corner=max_corner,
+        mesh_objects=mesh_objects,
+        width_mm=width,
+        height_mm=height,
+        depth_mm=depth,
+        center=(min_corner + max_corner) / 2,
+        mm_per_bu=mm_per_bu,
+    )
+
+
+# compute_collection_bounds() results per (collection name, unit scale)
+# for panel drawing. Dropped by _invalidate_bounds() whenever the depsgraph
+# reports object, mesh or collection changes, and on undo/redo/load.
+_bounds_cache: Dict[Tuple[str, float], Optional[CollectionBounds]] = {}
+
+
+@persistent
+def _invalidate_bounds(scene, depsgraph):
+    """Drop cached bounds when objects, meshes or collections change."""
+    if (depsgraph.id_type_updated('OBJECT') or depsgraph.id_type_updated('MESH')
+            or depsgraph.id_type_updated('COLLECTION')):
+        _bounds_cache.clear()
+
+
+def get_cached_collection_bounds(
+    collection: bpy.types.Collection,
+    mm_per_bu: float
+) -> Optional[CollectionBounds]:
+    """
+    Get compute_collection_bounds() for panel drawing, reused across redraws.
+
+    A redraw with no geometry change since the last one is a dict lookup
+    instead of a pass over every mesh. Operators call
+    compute_collection_bounds() directly.
+
+    Args:
+        collection: Collection to analyze
+        mm_per_bu: Unit conversion from get_mm_per_bu()
+
+    Returns:
+        CollectionBounds, or None if the collection has no valid meshes
+    """
+    key = (collection.name, mm_per_bu)
+    if key in _bounds_cache:
+        return _bounds_cache[key]
+
+    bounds = compute_collection_bounds(collection, mm_per_bu)
+    _bounds_cache[key] = bounds
+
+    return bounds
+
+
+def get_collection_dimensions(
+    collection: bpy.types.Collection,
+    mm_per_bu: Optional[float] = None
+) -> Tuple[float, float, float]:
     """
     Get combined dimensions of all mesh objects in a collection in millimeters.
 
@@ -372,30 +651,17 @@ def get_collection_dimensions(collection: bpy.types.Collection) -> Tuple[float,
 
     Args:
         collection: Collection to measure
+        mm_per_bu: Unit conversion from get_mm_per_bu() (read from the scene if None)
 
     Returns:
         (width, height, depth) in millimeters, or (0, 0, 0) if no valid meshes
     """
-    min_corner, max_corner, mesh_objects = get_collection_bounds(collection)
+    bounds = compute_collection_bounds(collection, mm_per_bu)
 
-    if min_corner is None:
+    if bounds is None:
         return 0.0, 0.0, 0.0
 
-    # Calculate dimensions in Blender Units
-    width = max_corner.x - min_corner.x
-    depth = max_corner.y - min_corner.y
-    height = max_corner.z - min_corner.z
-
-    # Convert to millimeters using scene unit scale
-    unit_scale = bpy.context.scene.unit_settings.scale_length
-    meters_per_bu = unit_scale
-    mm_per_meter = 1000.0
-
-    width_mm = width * meters_per_bu * mm_per_meter
-    height_mm = height * meters_per_bu * mm_per_meter
-    depth_mm = depth * meters_per_bu * mm_per_meter
-
-    return width_mm, height_mm, depth_mm
+    return bounds.width_mm, bounds.height_mm, bounds.depth_mm
 
 
 def get_collection_center(collection: bpy.types.Collection) -> Optional[Vector]:
@@ -408,18 +674,12 @@ def get_collection_center(collection: bpy.types.Collection) -> Optional[Vector]:
     Returns:
         Center point as Vector, or None if no valid meshes
     """
-    min_corner, max_corner, mesh_objects = get_collection_bounds(collection)
+    bounds = compute_collection_bounds(collection)
 
-    if min_corner is None:
+    if bounds is None:
         return None
 
-    center = Vector((
-        (max_corner.x + min_corner.x) / 2,
-        (max_corner.y + min_corner.y) / 2,
-        (max_corner.z + min_corner.z) / 2
-    ))
-
-    return center
+    return bounds.center.copy()
 
 
 def get_primary_object(collection: bpy.types.Collection) -> Optional[bpy.types.Object]:
@@ -452,11 +712,22 @@ def get_primary_object(collection: bpy.types.Collection) -> Optional[bpy.types.O
     return None
 
 
+# Characters replaced with underscores in output filenames, in one pass
+_FILENAME_TRANSLATE = str.maketrans({
+    ' ': '_',
+    '\t': '_',
+    '/': '_',
+    '\\': '_',
+    ':': '_',
+})
+
+
 def get_output_filename(collection_name: str, prefix: str) -> str:
     """
     Generate output filename from collection name.
 
-    Strips prefix and cleans up the name (spaces to underscores).
+    Strips prefix and cleans up the name (spaces and path separators to
+    underscores).
 
     Args:
         collection_name: Name of the collection
@@ -465,14 +736,9 @@ def get_output_filename(collection_name: str, prefix: str) -> str:
     Returns:
         Cleaned filename with .png extension
     """
-    name = collection_name
-    
-    if prefix and name.startswith(prefix):
-        name = name[len(prefix):]
-    
-    # Clean up: strip whitespace, replace spaces with underscores
-    name = name.strip().replace(' ', '_')
-    
+    # Clean up: strip whitespace, replace spaces and unsafe characters
+    name = collection_name.removeprefix(prefix).strip().translate(_FILENAME_TRANSLATE)
+
     return f"{name}.png"
 
 
@@ -491,9 +757,35 @@ def setup_render_settings():
     scene.render.film_transparent = True
 
 
+@contextmanager
+def redraw_viewports_after():
+    """
+    Tag the 3D viewports for redraw once a group of scene edits is done.
+
+    Nothing is deferred or evaluated here; Blender evaluates the depsgraph
+    lazily on the next redraw. Code that needs evaluated data right away
+    (rendering, camera fitting) calls view_layer.update() itself.
+    """
+    try:
+        yield
+    finally:
+        context = bpy.context
+
+        if context.screen is not None:
+            for area in context.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+
+
 def set_collection_visibility(target_collection, all_collections):
     """
     Show only the target collection, hide all others.
+
+    Each flag is read once into the returned snapshot and compared
+    against that, so only flags that actually change are written, render
+    flags first and viewport flags second, then the 3D viewports are
+    tagged for redraw once. Switching the shown collection therefore costs
+    four writes however many collections are managed.
     
     Args:
         target_collection: The collection to show
@@ -503,36 +795,74 @@ def set_collection_visibility(target_collection, all_collections):
         Dict of original visibility states for restoration
     """
     original_states = {}
-    
+
     for coll in all_collections:
         # Store original state
         original_states[coll.name] = {
             'hide_viewport': coll.hide_viewport,
             'hide_render': coll.hide_render
         }
-        
-        # Set visibility
-        if coll == target_collection:
-            coll.hide_viewport = False
-            coll.hide_render = False
-        else:
-            coll.hide_viewport = True
-            coll.hide_render = True
+
+    # (collection, hide, state) computed once for both passes
+    changes = [
+        (coll, coll != target_collection, original_states[coll.name])
+        for coll in all_collections
+    ]
+
+    with redraw_viewports_after():
+        for coll, hide, state in changes:
+            if state['hide_render'] != hide:
+                coll.hide_render = hide
+
+        for coll, hide, state in changes:
+            if state['hide_viewport'] != hide:
+                coll.hide_viewport = hide
     
     return original_states
 
 
+def switch_visible_collection(previous_collection, target_collection):
+    """
+    Move visibility from one collection to another.
+
+    For batch loops after set_collection_visibility() has isolated
+    previous_collection: only the two collections involved are touched,
+    instead of re-reading every managed collection's flags.
+
+    Args:
+        previous_collection: The collection currently shown
+        target_collection: The collection to show instead
+    """
+    if previous_collection == target_collection:
+        return
+
+    with redraw_viewports_after():
+        previous_collection.hide_render = True
+        target_collection.hide_render = False
+        previous_collection.hide_viewport = True
+        target_collection.hide_viewport = False
+
+
 def restore_collection_visibility(all_collections, original_states):
     """
     Restore collection visibility to original states.
     """
-    for coll in all_collections:
-        if coll.name in original_states:
-            coll.hide_viewport = original_states[coll.name]['hide_viewport']
-            coll.hide_render = original_states[coll.name]['hide_render']
+    with redraw_viewports_after():
+        for coll in all_collections:
+            state = original_states.get(coll.name)
+            if state is not None and coll.hide_render != state['hide_render']:
+                coll.hide_render = state['hide_render']
+
+        for coll in all_collections:
+            state = original_states.get(coll.name)
+            if state is not None and coll.hide_viewport != state['hide_viewport']:
+                coll.hide_viewport = state['hide_viewport']
 
 
-def validate_collection_dimensions(collection: bpy.types.Collection) -> Tuple[bool, str]:
+def validate_collection_dimensions(
+    collection: bpy.types.Collection,
+    bounds: Optional[CollectionBounds] = None
+) -> Tuple[bool, str]:
     """
     Validate that collection has non-zero dimensions and is within reasonable bounds.
 
@@ -545,22 +875,28 @@ def validate_collection_dimensions(collection: bpy.types.Collection) -> Tuple[bo
 
     Args:
         collection: Blender collection to validate
+        bounds: Precomputed compute_collection_bounds() result, if available
 
     Returns:
         (valid, message) tuple - valid is bool, message is error string if invalid
     """
-    width, height, depth = get_collection_dimensions(collection)
+    if bounds is None:
+        width, height, depth = get_collection_dimensions(collection)
+    else:
+        width, height, depth = bounds.width_mm, bounds.height_mm, bounds.depth_mm
+
+    dims = np.array((width, height, depth))
 
     # Check for zero or negative dimensions
-    if width <= 0 or height <= 0 or depth <= 0:
+    if (dims <= 0).any():
         return False, f"Collection '{collection.name}' has invalid dimensions: {width:.2f}×{height:.2f}×{depth:.2f}mm"
 
     # Check for unreasonably small objects (< 1mm - likely modeling error)
-    if width < 1 or height < 1:
+    if (dims[:2] < 1).any():
         return False, f"Collection '{collection.name}' too small (< 1mm): {width:.2f}×{height:.2f}mm"
 
     # Check for unreasonably large objects (> 10 meters)
-    if width > 10000 or height > 10000 or depth > 10000:
+    if (dims > 10000).any():
         return False, f"Collection '{collection.name}' too large (> 10m): {width:.1f}×{height:.1f}×{depth:.1f}mm"
 
     return True, ""
@@ -622,6 +958,17 @@ def get_or_create_camera(context: bpy.types.Context) -> bpy.types.Object:
     return camera
 
 
+@functools.lru_cache(maxsize=16)
+def _resolve_output_folder(output_folder: str, blend_filepath: str) -> str:
+    """
+    Resolve a possibly blend-relative folder path.
+
+    blend_filepath is part of the cache key so results are recomputed
+    when the .blend file is saved somewhere else.
+    """
+    return bpy.path.abspath(output_folder)
+
+
 def validate_output_path(output_folder: str) -> Tuple[bool, str, Optional[str]]:
     """
     Validate that output folder path is usable.
@@ -640,7 +987,7 @@ def validate_output_path(output_folder: str) -> Tuple[bool, str, Optional[str]]:
     import os
 
     # Resolve relative paths (// prefix means relative to .blend file)
-    resolved = bpy.path.abspath(output_folder)
+    resolved = _resolve_output_folder(output_folder, bpy.data.filepath)
 
     # Check if blend file is saved (needed for relative paths)
     if output_folder.startswith("//") and not bpy.data.is_saved:
@@ -650,14 +997,23 @@ def validate_output_path(output_folder: str) -> Tuple[bool, str, Optional[str]]:
     if not os.path.isabs(resolved) and not bpy.data.is_saved:
         return False, "Use absolute path or save .blend file first", None
 
-    # Check if parent directory exists (for creating output dir)
-    parent = os.path.dirname(resolved) if resolved else ""
-    if parent and not os.path.exists(parent):
-        return False, f"Parent directory does not exist: {parent}", None
+    folder = resolved.rstrip("/\\") or resolved
 
-    # Try to create directory and check permissions
+    # Fast path: the folder usually exists already, so one stat settles it
+    if os.path.isdir(folder):
+        if not os.access(folder, os.W_OK):
+            return False, f"No write permission: {resolved}", None
+        return True, "", resolved
+
+    # Create the directory in one call and classify failures from the
+    # exception, rather than stat-ing the parent first. mkdir (not
+    # makedirs) keeps the rule that the parent must already exist.
     try:
-        os.makedirs(resolved, exist_ok=True)
+        os.mkdir(folder)
+    except FileExistsError:
+        return False, f"Cannot create directory: {folder} is a file", None
+    except FileNotFoundError:
+        return False, f"Parent directory does not exist: {os.path.dirname(folder)}", None
     except PermissionError:
         return False, f"No write permission: {resolved}", None
     except Exception as e:
@@ -666,18 +1022,28 @@ def validate_output_path(output_folder: str) -> Tuple[bool, str, Optional[str]]:
     return True, "", resolved
 
 
-def resolve_output_filepath(base_path: str, overwrite_mode: str) -> Tuple[bool, str]:
+def resolve_output_filepath(
+    base_path: str,
+    overwrite_mode: str,
+    existing_files: Optional[Set[str]] = None
+) -> Tuple[bool, str]:
     """
     Resolve output file path based on overwrite mode.
 
     Modes:
     - OVERWRITE: Always use base_path
     - SKIP: Don't render if file exists
-    - INCREMENT: Auto-number (_001, _002, etc.) if file exists
+    - INCREMENT: Auto-number (_001, _002, etc.) if file exists, using the
+      number after the highest one already in the folder
+
+    Batch callers can list the output folder once and pass the names as
+    existing_files; lookups then hit the set instead of the filesystem.
+    The caller is responsible for adding names it renders to the set.
 
     Args:
         base_path: Desired output file path
         overwrite_mode: 'OVERWRITE', 'SKIP', or 'INCREMENT'
+        existing_files: File names already in base_path's folder, if known
 
     Returns:
         (should_render, final_path) tuple
@@ -687,20 +1053,71 @@ def resolve_output_filepath(base_path: str, overwrite_mode: str) -> Tuple[bool,
     if overwrite_mode == 'OVERWRITE':
         return True, base_path
 
+    if existing_files is None:
+        exists = os.path.exists(base_path)
+    else:
+        exists = os.path.basename(base_path) in existing_files
+
     if overwrite_mode == 'SKIP':
-        if os.path.exists(base_path):
+        if exists:
             return False, base_path
         return True, base_path
 
     if overwrite_mode == 'INCREMENT':
-        if not os.path.exists(base_path):
+        if not exists:
             return True, base_path
 
-        # Find next available number
+        # Find the highest existing number with one directory scan
+        # instead of probing each candidate name
         base, ext = os.path.splitext(base_path)
-        counter = 1
-        while os.path.exists(f"{base}_{counter:03d}{ext}"):
-            counter += 1
-        return True, f"{base}_{counter:03d}{ext}"
+        head = os.path.basename(base) + "_"
+        start, end = len(head), -len(ext) or None
+
+        if existing_files is None:
+            with os.scandir(os.path.dirname(base_path) or ".") as entries:
+                names = [entry.name for entry in entries]
+        else:
+            names = existing_files
+
+        # Names of the form <stem>_<3+ digits><ext>
+        counter = 0
+        for name in names:
+            if name.startswith(head) and name.endswith(ext):
+                digits = name[start:end]
+                if len(digits) >= 3 and digits.isascii() and digits.isdigit():
+                    number = int(digits)
+                    if number > counter:
+                        counter = number
+
+        return True, f"{base}_{counter + 1:03d}{ext}"
 
     return True, base_path
+
+
+_CLEAR_HANDLERS = (
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+    bpy.app.handlers.load_post,
+)
+
+
+def register():
+    for handlers in _CLEAR_HANDLERS:
+        if _clear_caches not in handlers:
+            handlers.append(_clear_caches)
+
+    for handler in (_update_prefix_index, _invalidate_bounds):
+        if handler not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(handler)
+
+
+def unregister():
+    for handler in (_update_prefix_index, _invalidate_bounds):
+        if handler in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(handler)
+
+    for handlers in _CLEAR_HANDLERS:
+        if _clear_caches in handlers:
+            handlers.remove(_clear_caches)
+
+    _clear_caches()
@@ -6,7 +6,7 @@ Handles default scaling light rig and per-collection overrides
 import bpy
 import math
 from mathutils import Vector
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 from . import core
 
@@ -31,11 +31,28 @@ KEY_LIGHT_SIZE = 2.0   # Smaller for sharper shadows
 FILL_LIGHT_SIZE = 3.0  # Larger for softer fill
 RIM_LIGHT_SIZE = 1.5   # Small for edge highlight
 
-# Light rotation angles (in degrees, converted to radians in code)
+# Base light object names. Blender adds a suffix (".001") if the name is
+# taken, so the rig records the names its lights actually got
+KEY_LIGHT_NAME = "SCALE_RENDER_Key"
+FILL_LIGHT_NAME = "SCALE_RENDER_Fill"
+RIM_LIGHT_NAME = "SCALE_RENDER_Rim"
+
+# Light rotation angles (in degrees, converted to radians once below)
 KEY_LIGHT_ROTATION = (45, 0, 30)
 FILL_LIGHT_ROTATION = (60, 0, -45)
 RIM_LIGHT_ROTATION = (135, 0, 20)
 
+KEY_LIGHT_ROTATION_RAD = tuple(math.radians(a) for a in KEY_LIGHT_ROTATION)
+FILL_LIGHT_ROTATION_RAD = tuple(math.radians(a) for a in FILL_LIGHT_ROTATION)
+RIM_LIGHT_ROTATION_RAD = tuple(math.radians(a) for a in RIM_LIGHT_ROTATION)
+
+# Per-light settings by role: (name, base energy, base size, offset, rotation)
+LIGHT_ROLES = (
+    (KEY_LIGHT_NAME, BASE_KEY_ENERGY, KEY_LIGHT_SIZE, KEY_LIGHT_OFFSET, KEY_LIGHT_ROTATION_RAD),
+    (FILL_LIGHT_NAME, BASE_FILL_ENERGY, FILL_LIGHT_SIZE, FILL_LIGHT_OFFSET, FILL_LIGHT_ROTATION_RAD),
+    (RIM_LIGHT_NAME, BASE_RIM_ENERGY, RIM_LIGHT_SIZE, RIM_LIGHT_OFFSET, RIM_LIGHT_ROTATION_RAD),
+)
+
 
 def collection_has_lights(collection: bpy.types.Collection) -> bool:
     """
@@ -65,11 +82,7 @@ def count_collection_lights(collection: bpy.types.Collection) -> int:
     Returns:
         Number of light objects found
     """
-    count = 0
-    for obj in collection.objects:
-        if obj.type == 'LIGHT':
-            count += 1
-    return count
+    return sum(1 for obj in collection.objects if obj.type == 'LIGHT')
 
 
 def get_or_create_light_rig() -> bpy.types.Object:
@@ -83,47 +96,61 @@ def get_or_create_light_rig() -> bpy.types.Object:
         The rig empty object (parent of all lights)
     """
     # Check if rig already exists
-    if LIGHT_RIG_NAME in bpy.data.objects:
-        return bpy.data.objects[LIGHT_RIG_NAME]
+    rig = bpy.data.objects.get(LIGHT_RIG_NAME)
+    if rig is not None:
+        return rig
     
-    # Create the rig empty
-    bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-    rig_empty = bpy.context.active_object
-    rig_empty.name = LIGHT_RIG_NAME
+    # Create the rig empty directly (no operator, undo push or selection
+    # change), linked to the scene root like the lights
+    rig_empty = bpy.data.objects.new(name=LIGHT_RIG_NAME, object_data=None)
+    rig_empty.empty_display_type = 'PLAIN_AXES'
+    bpy.context.scene.collection.objects.link(rig_empty)
     
-    # Create key light (front-right, above)
-    key_light = create_area_light(
-        name="SCALE_RENDER_Key",
-        energy=BASE_KEY_ENERGY,
-        size=KEY_LIGHT_SIZE,
-        location=KEY_LIGHT_OFFSET,
-        rotation=tuple(math.radians(a) for a in KEY_LIGHT_ROTATION)
-    )
-    key_light.parent = rig_empty
-
-    # Create fill light (front-left, lower)
-    fill_light = create_area_light(
-        name="SCALE_RENDER_Fill",
-        energy=BASE_FILL_ENERGY,
-        size=FILL_LIGHT_SIZE,
-        location=FILL_LIGHT_OFFSET,
-        rotation=tuple(math.radians(a) for a in FILL_LIGHT_ROTATION)
-    )
-    fill_light.parent = rig_empty
-
-    # Create rim light (behind, for edge separation)
-    rim_light = create_area_light(
-        name="SCALE_RENDER_Rim",
-        energy=BASE_RIM_ENERGY,
-        size=RIM_LIGHT_SIZE,
-        location=RIM_LIGHT_OFFSET,
-        rotation=tuple(math.radians(a) for a in RIM_LIGHT_ROTATION)
-    )
-    rim_light.parent = rig_empty
+    # Create key (front-right, above), fill (front-left, lower) and
+    # rim (behind, for edge separation) lights
+    light_refs = {}
+    for name, energy, size, offset, rotation in LIGHT_ROLES:
+        light = create_area_light(
+            name=name,
+            energy=energy,
+            size=size,
+            location=offset,
+            rotation=rotation
+        )
+        light.parent = rig_empty
+        light_refs[name] = light.name
+
+    rig_empty["_light_refs"] = light_refs
     
     return rig_empty
 
 
+def _get_rig_lights(rig: bpy.types.Object) -> Dict[str, bpy.types.Object]:
+    """
+    Map each role's base light name to the rig's light for that role.
+
+    Uses the light names recorded on the rig, so an unparented orphan
+    still holding a base name is never mistaken for the rig's own light.
+    Rigs without the record fall back to their children.
+    """
+    lights = {}
+    refs = rig.get("_light_refs")
+
+    if refs is None:
+        for child in rig.children:
+            if child.type == 'LIGHT':
+                lights.setdefault(child.name.partition(".")[0], child)
+        return lights
+
+    objects = bpy.data.objects
+    for name, _, _, _, _ in LIGHT_ROLES:
+        light = objects.get(refs.get(name, ""))
+        if light is not None and light.type == 'LIGHT' and light.parent == rig:
+            lights[name] = light
+
+    return lights
+
+
 def create_area_light(
     name: str,
     energy: float,
@@ -163,7 +190,10 @@ def create_area_light(
     return light_obj
 
 
-def scale_light_rig_for_collection(collection: bpy.types.Collection) -> None:
+def scale_light_rig_for_collection(
+    collection: bpy.types.Collection,
+    bounds: Optional[core.CollectionBounds] = None
+) -> None:
     """
     Scale the default light rig to match the collection's combined size.
 
@@ -175,14 +205,19 @@ def scale_light_rig_for_collection(collection: bpy.types.Collection) -> None:
 
     Args:
         collection: Collection to scale rig for
+        bounds: Precomputed core.compute_collection_bounds() result, if available
     """
-    from . import core  # Import here to avoid circular dependency
-
     rig = get_or_create_light_rig()
 
     # Get collection dimensions and center
-    width, height, depth = core.get_collection_dimensions(collection)
-    collection_center = core.get_collection_center(collection)
+    if bounds is None:
+        bounds = core.compute_collection_bounds(collection)
+
+    if bounds is None:
+        return
+
+    height = bounds.height_mm
+    collection_center = bounds.center
 
     # Calculate scale factor based on height vs reference
     scale_factor = height / REFERENCE_HEIGHT
@@ -199,42 +234,57 @@ def scale_light_rig_for_collection(collection: bpy.types.Collection) -> None:
     # Adjust light intensities to compensate for distance (inverse square)
     intensity_multiplier = scale_factor ** 2
 
-    for child in rig.children:
-        if child.type == 'LIGHT':
-            light_data = child.data
-            base_name = child.name.replace("SCALE_RENDER_", "")
+    # Look each light up through the names recorded on the rig
+    lights = _get_rig_lights(rig)
+    refs_stale = "_light_refs" not in rig
+    for name, base_energy, base_size, offset, rotation in LIGHT_ROLES:
+        light = lights.get(name)
+        if light is None:
+            # Repair a rig that lost a light in place; the rest of the
+            # rig is reused and only mutated, never rebuilt
+            light = create_area_light(name, base_energy, base_size, offset, rotation)
+            light.parent = rig
+            lights[name] = light
+            refs_stale = True
+
+        light_data = light.data
+        light_data.energy = base_energy * intensity_multiplier
 
-            if "Key" in base_name:
-                light_data.energy = BASE_KEY_ENERGY * intensity_multiplier
-            elif "Fill" in base_name:
-                light_data.energy = BASE_FILL_ENERGY * intensity_multiplier
-            elif "Rim" in base_name:
-                light_data.energy = BASE_RIM_ENERGY * intensity_multiplier
+        # Also scale the light size, keeping each light's own base size
+        light_data.size = base_size * scale_factor
 
-            # Also scale the light size
-            light_data.size = 2.0 * scale_factor
+    if refs_stale:
+        rig["_light_refs"] = {name: lights[name].name for name, *_ in LIGHT_ROLES}
 
 
 def show_light_rig(show=True):
     """
     Show or hide the default light rig.
+
+    Flags are only written when they change, so calling this for every
+    collection in a batch costs nothing while the rig's state is stable.
     """
-    if LIGHT_RIG_NAME not in bpy.data.objects:
+    rig = bpy.data.objects.get(LIGHT_RIG_NAME)
+    if rig is None:
         if show:
             get_or_create_light_rig()
         return
-    
-    rig = bpy.data.objects[LIGHT_RIG_NAME]
-    rig.hide_viewport = not show
-    rig.hide_render = not show
-    
-    # Also hide/show children
-    for child in rig.children:
-        child.hide_viewport = not show
-        child.hide_render = not show
 
+    hide = not show
 
-def setup_lighting_for_collection(collection: bpy.types.Collection) -> str:
+    # Check the rig and each child separately; a light can be toggled by
+    # hand without its parent
+    for obj in (rig, *rig.children):
+        if obj.hide_viewport != hide:
+            obj.hide_viewport = hide
+        if obj.hide_render != hide:
+            obj.hide_render = hide
+
+
+def setup_lighting_for_collection(
+    collection: bpy.types.Collection,
+    bounds: Optional[core.CollectionBounds] = None
+) -> str:
     """
     Set up lighting for rendering a collection.
 
@@ -245,21 +295,22 @@ def setup_lighting_for_collection(collection: bpy.types.Collection) -> str:
 
     Args:
         collection: Collection being rendered
+        bounds: Precomputed core.compute_collection_bounds() result, if available
 
     Returns:
         Description of lighting setup for UI feedback
     """
-    from . import core  # Import here to avoid circular dependency
+    # One pass both detects and counts collection lights
+    light_count = count_collection_lights(collection)
 
-    if collection_has_lights(collection):
+    if light_count:
         # Use collection's own lights
         show_light_rig(show=False)
-        light_count = count_collection_lights(collection)
         return f"Using collection lights ({light_count} found)"
     else:
         # Use and scale default rig based on collection dimensions
         show_light_rig(show=True)
-        scale_light_rig_for_collection(collection)
+        scale_light_rig_for_collection(collection, bounds=bounds)
         return "Using scaled default lighting"
 
 
@@ -268,11 +319,10 @@ def delete_light_rig():
     Remove the default light rig entirely.
     Useful for cleanup or reset.
     """
-    if LIGHT_RIG_NAME not in bpy.data.objects:
+    rig = bpy.data.objects.get(LIGHT_RIG_NAME)
+    if rig is None:
         return
     
-    rig = bpy.data.objects[LIGHT_RIG_NAME]
-    
     # Delete children first
     for child in rig.children:
         if child.type == 'LIGHT':
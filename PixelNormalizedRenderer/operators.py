@@ -5,12 +5,133 @@ Eval, Render Active, and Render All functionality
 
 import bpy
 import os
+import traceback
 from bpy.types import Operator
+from dataclasses import dataclass
+from mathutils import Vector
+from typing import Optional, Set, Tuple
 
 from . import core
 from . import lighting
 
 
+def evaluate_collection(context, collection):
+    """
+    Frame, light and isolate a collection for rendering.
+
+    Shared by Eval and Render Active so rendering the active collection
+    is a direct call rather than a nested bpy.ops.scale_render.eval()
+    dispatch (which builds a new operator context and pushes an extra
+    undo step).
+
+    Args:
+        context: Blender context
+        collection: Collection to set up
+
+    Returns:
+        (valid, message, info) tuple - message is the error if not valid,
+        otherwise a warning or ""; info holds width/height/depth (mm),
+        res_x/res_y and lighting_info
+    """
+    props = context.scene.scale_render_props
+    runtime = context.window_manager.scale_render_runtime
+
+    # Compute combined bounds once and share them below
+    # (None means the collection has no mesh objects)
+    bounds = core.compute_collection_bounds(collection, core.get_mm_per_bu(context.scene))
+    if bounds is None:
+        return False, f"No mesh objects found in collection '{collection.name}'", None
+
+    # Validate collection dimensions (handles multiple meshes)
+    valid, msg = core.validate_collection_dimensions(collection, bounds=bounds)
+    if not valid:
+        return False, msg, None
+
+    # Combined dimensions of all meshes in collection
+    width, height, depth = bounds.width_mm, bounds.height_mm, bounds.depth_mm
+
+    # Calculate resolution
+    res_x, res_y = core.calculate_resolution(
+        width, height,
+        props.scale_factor,
+        props.padding_px
+    )
+
+    # Validate resolution; a message with valid=True is a warning
+    valid, warning = core.validate_resolution(res_x, res_y)
+    if not valid:
+        return False, warning, None
+
+    # Set render resolution
+    context.scene.render.resolution_x = res_x
+    context.scene.render.resolution_y = res_y
+    context.scene.render.resolution_percentage = 100
+
+    # Set up render settings (transparent, PNG)
+    core.setup_render_settings()
+
+    # Get or create camera
+    camera = core.get_or_create_camera(context)
+
+    # Position camera to frame entire collection
+    location, rotation = core.calculate_camera_position(
+        collection,
+        props.scale_factor,
+        props.padding_px,
+        bounds=bounds,
+        resolution=(res_x, res_y)
+    )
+
+    # Debug output
+    print(f"DEBUG: Collection: {collection.name}")
+    print(f"DEBUG: Width={width:.1f}, Height={height:.1f}, Depth={depth:.1f} mm")
+    print(f"DEBUG: Camera location: {location}")
+    print(f"DEBUG: Camera rotation: {rotation}")
+
+    camera.location = location
+    camera.rotation_euler = rotation
+
+    # Force update the camera transform
+    camera.update_tag()
+    context.view_layer.update()
+
+    # Set camera as active
+    context.scene.camera = camera
+
+    # Set up lighting (uses collection center)
+    lighting_info = lighting.setup_lighting_for_collection(collection, bounds=bounds)
+
+    # Isolate collection - hide all other RENDER_ collections
+    all_render_collections = core.scan_filtered_collections(props.collection_prefix)
+    core.set_collection_visibility(collection, all_render_collections)
+
+    # Store evaluated info for display
+    runtime.last_evaluated_collection = collection.name
+    runtime.last_eval_width = width
+    runtime.last_eval_height = height
+    runtime.last_eval_depth = depth
+    runtime.last_eval_res_x = res_x
+    runtime.last_eval_res_y = res_y
+
+    # Update viewport to show camera view; a VIEW_3D area's active space
+    # is its 3D view, so there is no need to scan area.spaces
+    if context.screen is not None:
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.spaces.active.region_3d.view_perspective = 'CAMERA'
+
+    info = {
+        'width': width,
+        'height': height,
+        'depth': depth,
+        'res_x': res_x,
+        'res_y': res_y,
+        'lighting_info': lighting_info,
+    }
+
+    return True, warning, info
+
+
 class SCALE_RENDER_OT_eval(Operator):
     """Set up camera and resolution for the active collection without rendering"""
     bl_idname = "scale_render.eval"
@@ -27,8 +148,9 @@ class SCALE_RENDER_OT_eval(Operator):
         print("DEBUG operators.py: Eval execute() called")
         print("=" * 80)
         props = context.scene.scale_render_props
+        runtime = context.window_manager.scale_render_runtime
         print(f"DEBUG operators.py: selected_collection = '{props.selected_collection}'")
-        print(f"DEBUG operators.py: last_evaluated_collection = '{props.last_evaluated_collection}'")
+        print(f"DEBUG operators.py: last_evaluated_collection = '{runtime.last_evaluated_collection}'")
 
         # Get selected collection from dropdown
         if not props.selected_collection:
@@ -43,92 +165,17 @@ class SCALE_RENDER_OT_eval(Operator):
             self.report({'ERROR'}, f"Collection '{props.selected_collection}' not found")
             return {'CANCELLED'}
 
-        # Check that collection has mesh objects
-        obj = core.get_primary_object(collection)
-        if obj is None:
-            self.report({'ERROR'}, f"No mesh objects found in collection '{collection.name}'")
-            return {'CANCELLED'}
-
-        # Validate collection dimensions (handles multiple meshes)
-        valid, msg = core.validate_collection_dimensions(collection)
-        if not valid:
-            self.report({'ERROR'}, msg)
-            return {'CANCELLED'}
-
-        # Calculate combined dimensions of all meshes in collection
-        width, height, depth = core.get_collection_dimensions(collection)
-
-        # Calculate resolution
-        res_x, res_y = core.calculate_resolution(
-            width, height,
-            props.scale_factor,
-            props.padding_px
-        )
-
-        # Validate resolution
-        valid, msg = core.validate_resolution(res_x, res_y)
+        valid, msg, info = evaluate_collection(context, collection)
         if not valid:
             self.report({'ERROR'}, msg)
             return {'CANCELLED'}
         elif msg:  # Warning message
             self.report({'WARNING'}, msg)
 
-        # Set render resolution
-        context.scene.render.resolution_x = res_x
-        context.scene.render.resolution_y = res_y
-        context.scene.render.resolution_percentage = 100
-
-        # Set up render settings (transparent, PNG)
-        core.setup_render_settings()
-
-        # Get or create camera
-        camera = core.get_or_create_camera(context)
-
-        # Position camera to frame entire collection
-        location, rotation = core.calculate_camera_position(
-            collection,
-            props.scale_factor,
-            props.padding_px
-        )
-
-        # Debug output
-        print(f"DEBUG: Collection: {collection.name}")
-        print(f"DEBUG: Width={width:.1f}, Height={height:.1f}, Depth={depth:.1f} mm")
-        print(f"DEBUG: Camera location: {location}")
-        print(f"DEBUG: Camera rotation: {rotation}")
-
-        camera.location = location
-        camera.rotation_euler = rotation
-
-        # Force update the camera transform
-        camera.update_tag()
-        context.view_layer.update()
-
-        # Set camera as active
-        context.scene.camera = camera
-
-        # Set up lighting (uses collection center)
-        lighting_info = lighting.setup_lighting_for_collection(collection)
-
-        # Isolate collection - hide all other RENDER_ collections
-        all_render_collections = core.get_filtered_collections(props.collection_prefix)
-        core.set_collection_visibility(collection, all_render_collections)
-
-        # Store evaluated info for display
-        props.last_evaluated_collection = collection.name
-        props.last_eval_width = width
-        props.last_eval_height = height
-        props.last_eval_depth = depth
-        props.last_eval_res_x = res_x
-        props.last_eval_res_y = res_y
-
-        # Update viewport to show camera view
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        space.region_3d.view_perspective = 'CAMERA'
-                        break
+        width, height = info['width'], info['height']
+        res_x, res_y = info['res_x'], info['res_y']
+        lighting_info = info['lighting_info']
+        camera = context.scene.camera
 
         # Report results
         result_msg = f"Eval: {collection.name} | {width:.1f}×{height:.1f}mm → {res_x}×{res_y}px | {lighting_info}"
@@ -173,8 +220,13 @@ class SCALE_RENDER_OT_render_active(Operator):
             self.report({'ERROR'}, f"Collection '{props.selected_collection}' not found")
             return {'CANCELLED'}
 
-        # First run eval to set everything up
-        bpy.ops.scale_render.eval()
+        # Set everything up the same way Eval does
+        valid, msg, _ = evaluate_collection(context, collection)
+        if not valid:
+            self.report({'ERROR'}, msg)
+            return {'CANCELLED'}
+        elif msg:  # Warning message
+            self.report({'WARNING'}, msg)
 
         filename = core.get_output_filename(collection.name, props.collection_prefix)
         filepath = os.path.join(output_dir, filename)
@@ -199,6 +251,104 @@ class SCALE_RENDER_OT_render_active(Operator):
         return {'FINISHED'}
 
 
+@dataclass
+class RenderPlan:
+    """Everything Render All needs to render one collection."""
+    collection: bpy.types.Collection
+    bounds: core.CollectionBounds
+    res_x: int
+    res_y: int
+    location: Vector
+    rotation: Tuple[float, float, float]
+    filename: str
+    final_path: str
+    final_name: str  # basename of final_path (differs from filename when auto-numbered)
+    should_render: bool
+
+
+def plan_collection_render(
+    collection: bpy.types.Collection,
+    props,
+    mm_per_bu: float,
+    output_dir: str,
+    existing_files: Set[str]
+) -> Tuple[Optional[RenderPlan], str]:
+    """
+    Validate a collection and work out how to render it, without touching the scene.
+
+    The chosen output name is added to existing_files straight away, so
+    auto-numbering stays unique across the collections planned after it.
+
+    Args:
+        collection: Collection to plan
+        props: Scene scale_render_props
+        mm_per_bu: Unit conversion from core.get_mm_per_bu()
+        output_dir: Resolved output folder
+        existing_files: File names already in output_dir (updated in place)
+
+    Returns:
+        (plan, message) tuple - plan is None and message the error if invalid
+    """
+    # Compute combined bounds once and share them below
+    # (None means the collection has no mesh objects)
+    bounds = core.compute_collection_bounds(collection, mm_per_bu)
+
+    if bounds is None:
+        return None, "No mesh objects found"
+
+    # Validate collection dimensions (handles multiple meshes)
+    valid, msg = core.validate_collection_dimensions(collection, bounds=bounds)
+    if not valid:
+        return None, msg
+
+    # Combined dimensions of all meshes
+    res_x, res_y = core.calculate_resolution(
+        bounds.width_mm, bounds.height_mm,
+        props.scale_factor,
+        props.padding_px
+    )
+
+    # Validate resolution
+    valid, msg = core.validate_resolution(res_x, res_y)
+    if not valid:
+        return None, msg
+
+    # Position camera to frame entire collection
+    location, rotation = core.calculate_camera_position(
+        collection,
+        props.scale_factor,
+        props.padding_px,
+        bounds=bounds,
+        resolution=(res_x, res_y)
+    )
+
+    # Output path and overwrite mode
+    filename = core.get_output_filename(collection.name, props.collection_prefix)
+    filepath = os.path.join(output_dir, filename)
+
+    should_render, final_path = core.resolve_output_filepath(
+        filepath, props.overwrite_mode, existing_files
+    )
+    final_name = os.path.basename(final_path)
+    if should_render:
+        existing_files.add(final_name)
+
+    plan = RenderPlan(
+        collection=collection,
+        bounds=bounds,
+        res_x=res_x,
+        res_y=res_y,
+        location=location,
+        rotation=rotation,
+        filename=filename,
+        final_path=final_path,
+        final_name=final_name,
+        should_render=should_render,
+    )
+
+    return plan, ""
+
+
 class SCALE_RENDER_OT_render_all(Operator):
     """Batch render all collections matching the prefix"""
     bl_idname = "scale_render.render_all"
@@ -214,7 +364,7 @@ class SCALE_RENDER_OT_render_all(Operator):
         props = context.scene.scale_render_props
         
         # Get all matching collections
-        collections = core.get_filtered_collections(props.collection_prefix)
+        collections = core.scan_filtered_collections(props.collection_prefix)
         
         if not collections:
             self.report({'ERROR'}, f"No collections found matching prefix '{props.collection_prefix}'")
@@ -225,6 +375,16 @@ class SCALE_RENDER_OT_render_all(Operator):
         if not valid:
             self.report({'ERROR'}, msg)
             return {'CANCELLED'}
+
+        # List the output folder once; planned names are added as they are
+        # chosen. OVERWRITE never looks at existing names, so skip the listing
+        existing_files = set()
+        if props.overwrite_mode != 'OVERWRITE':
+            try:
+                existing_files.update(os.listdir(output_dir))
+            except OSError as e:
+                self.report({'ERROR'}, f"Cannot read output folder: {str(e)}")
+                return {'CANCELLED'}
         
         # Set up render settings
         core.setup_render_settings()
@@ -233,12 +393,51 @@ class SCALE_RENDER_OT_render_all(Operator):
         camera = core.get_or_create_camera(context)
         context.scene.camera = camera
 
+        # Create the light rig up front; per collection it is only
+        # shown/hidden and rescaled
+        lighting.get_or_create_light_rig()
+
+        # Unit scale can't change during the batch, read it once
+        mm_per_bu = core.get_mm_per_bu(context.scene)
+
         # Track results
         successful = 0
         failed = 0
         skipped = 0
         errors = []
 
+        # Plan every collection up front: validation, framing and output
+        # names are all decided here, so the render loop below only sets
+        # scene state and renders
+        plans = []
+        plan_log = []
+        for collection in collections:
+            try:
+                plan, msg = plan_collection_render(
+                    collection, props, mm_per_bu, output_dir, existing_files
+                )
+            except (RuntimeError, ValueError, TypeError) as e:
+                plan, msg = None, str(e)
+            except Exception as e:
+                # Like the render loop, report unexpected errors and carry on
+                plan, msg = None, f"UNEXPECTED ERROR: {str(e)}"
+                traceback.print_exc()
+
+            if plan is None:
+                errors.append(f"{collection.name}: {msg}")
+                failed += 1
+                plan_log.append(f"  ✗ {collection.name}: {msg}")
+            elif not plan.should_render:
+                skipped += 1
+                plan_log.append(f"  ⊘ {plan.filename} (skipped - file exists)")
+            else:
+                plans.append(plan)
+
+        # Planning is fast, so its per-collection lines go out in one write;
+        # the render loop keeps printing live since each step takes a while
+        if plan_log:
+            print("\n".join(plan_log), flush=True)
+
         # Store original visibility states
         original_states = {}
         for coll in collections:
@@ -249,83 +448,40 @@ class SCALE_RENDER_OT_render_all(Operator):
 
         # Set up progress indicator
         wm = context.window_manager
-        wm.progress_begin(0, len(collections))
+        wm.progress_begin(0, len(plans))
 
-        # Process each collection
-        for i, collection in enumerate(collections):
+        # Render each planned collection
+        shown = None
+        for i, plan in enumerate(plans):
+            collection = plan.collection
             wm.progress_update(i)
-            print(f"Rendering {i+1}/{len(collections)}: {collection.name}")
+            print(f"Rendering {i+1}/{len(plans)}: {collection.name}")
 
             try:
-                # Check that collection has mesh objects
-                obj = core.get_primary_object(collection)
-
-                if obj is None:
-                    errors.append(f"{collection.name}: No mesh objects found")
-                    failed += 1
-                    continue
-
-                # Validate collection dimensions (handles multiple meshes)
-                valid, msg = core.validate_collection_dimensions(collection)
-                if not valid:
-                    errors.append(f"{collection.name}: {msg}")
-                    failed += 1
-                    continue
-
-                # Set visibility - show only this collection
-                core.set_collection_visibility(collection, collections)
-
-                # Calculate combined dimensions of all meshes
-                width, height, depth = core.get_collection_dimensions(collection)
-                res_x, res_y = core.calculate_resolution(
-                    width, height,
-                    props.scale_factor,
-                    props.padding_px
-                )
-
-                # Validate resolution
-                valid, msg = core.validate_resolution(res_x, res_y)
-                if not valid:
-                    errors.append(f"{collection.name}: {msg}")
-                    failed += 1
-                    continue
-
-                # Set resolution
-                context.scene.render.resolution_x = res_x
-                context.scene.render.resolution_y = res_y
-
-                # Position camera to frame entire collection
-                location, rotation = core.calculate_camera_position(
-                    collection,
-                    props.scale_factor,
-                    props.padding_px
-                )
-                camera.location = location
-                camera.rotation_euler = rotation
+                # Set visibility - show only this collection. After the
+                # first full pass only the previous and next collections change
+                if shown is None:
+                    core.set_collection_visibility(collection, collections)
+                else:
+                    core.switch_visible_collection(shown, collection)
+                shown = collection
+
+                # Set resolution and camera from the plan
+                context.scene.render.resolution_x = plan.res_x
+                context.scene.render.resolution_y = plan.res_y
+                camera.location = plan.location
+                camera.rotation_euler = plan.rotation
 
                 # Set up lighting (uses collection center)
-                lighting.setup_lighting_for_collection(collection)
-
-                # Set output path and check overwrite mode
-                filename = core.get_output_filename(collection.name, props.collection_prefix)
-                filepath = os.path.join(output_dir, filename)
-
-                # Check overwrite mode
-                should_render, final_path = core.resolve_output_filepath(filepath, props.overwrite_mode)
-
-                if not should_render:
-                    skipped += 1
-                    print(f"  ⊘ {filename} (skipped - file exists)")
-                    continue
+                lighting.setup_lighting_for_collection(collection, bounds=plan.bounds)
 
-                context.scene.render.filepath = final_path
+                context.scene.render.filepath = plan.final_path
 
                 # Render
                 bpy.ops.render.render(write_still=True)
 
                 successful += 1
-                actual_filename = os.path.basename(final_path)
-                print(f"  ✓ {actual_filename} ({res_x}×{res_y})")
+                print(f"  ✓ {plan.final_name} ({plan.res_x}×{plan.res_y})")
 
             except (RuntimeError, ValueError, TypeError) as e:
                 errors.append(f"{collection.name}: {str(e)}")
@@ -343,7 +499,6 @@ class SCALE_RENDER_OT_render_all(Operator):
                 errors.append(f"{collection.name}: UNEXPECTED ERROR: {str(e)}")
                 failed += 1
                 print(f"  ✗ UNEXPECTED ERROR: {str(e)}")
-                import traceback
                 traceback.print_exc()
 
         # End progress indicator
@@ -363,8 +518,7 @@ class SCALE_RENDER_OT_render_all(Operator):
             summary += f", {failed} failed"
 
         if errors:
-            for err in errors:
-                print(f"Error: {err}")
+            print("\n".join(f"Error: {err}" for err in errors), flush=True)
 
         self.report({'INFO'}, summary)
 
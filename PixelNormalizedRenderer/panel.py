@@ -4,12 +4,69 @@ Sidebar panel in 3D Viewport
 """
 
 import bpy
+import time
 from bpy.types import Panel, Menu, Operator
 from bpy.props import StringProperty
 
 from . import core
 
 
+# Redraw throttling: bursts of requests within the interval coalesce into
+# one tag_redraw per area, flushed by a one-shot timer
+REDRAW_INTERVAL = 0.1  # seconds
+_pending_redraw_areas = []
+
+# Last selected-collection info drawn, as [key, info]; recomputed only when
+# the collection, its bounds, scale or padding change
+_info_cache = [None, None]
+
+# Time of the last scale/padding edit. While edits keep arriving within
+# REDRAW_INTERVAL (a slider drag) the info box keeps its previous values
+_framing_changed_at = 0.0
+
+
+def _flush_redraws():
+    """Timer callback: redraw every queued area once."""
+    for area in _pending_redraw_areas:
+        try:
+            area.tag_redraw()
+        except ReferenceError:
+            # Area was closed since it was queued
+            pass
+
+    _pending_redraw_areas.clear()
+    return None  # Don't repeat
+
+
+def request_redraw(area) -> None:
+    """
+    Queue an area for redraw at most once per REDRAW_INTERVAL.
+
+    Args:
+        area: Area to redraw (ignored if None)
+    """
+    if area is None:
+        return
+
+    if area not in _pending_redraw_areas:
+        _pending_redraw_areas.append(area)
+
+    if not bpy.app.timers.is_registered(_flush_redraws):
+        bpy.app.timers.register(_flush_redraws, first_interval=REDRAW_INTERVAL)
+
+
+def note_framing_changed(area) -> None:
+    """
+    Record a scale or padding edit and queue a redraw for when it settles.
+
+    Args:
+        area: Area the edit came from (ignored if None)
+    """
+    global _framing_changed_at
+    _framing_changed_at = time.monotonic()
+    request_redraw(area)
+
+
 class SCALE_RENDER_OT_select_collection(Operator):
     """Select a collection for evaluation and rendering"""
     bl_idname = "scale_render.select_collection"
@@ -29,14 +86,9 @@ class SCALE_RENDER_OT_select_collection(Operator):
         # Isolate selected collection - hide all other RENDER_ collections
         collection = bpy.data.collections.get(self.collection_name)
         if collection:
-            all_render_collections = core.get_filtered_collections(props.collection_prefix)
+            all_render_collections = core.scan_filtered_collections(props.collection_prefix)
             core.set_collection_visibility(collection, all_render_collections)
 
-        # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
-
         return {'FINISHED'}
 
 
@@ -55,14 +107,17 @@ class SCALE_RENDER_MT_collection_menu(Menu):
             layout.label(text="No collections found", icon='ERROR')
             return
 
-        for coll in collections:
-            # Check if collection has valid mesh objects
-            obj = core.get_primary_object(coll)
-            icon = 'OUTLINER_COLLECTION' if obj else 'ERROR'
+        selected = props.selected_collection
 
-            # Add checkmark to currently selected
-            if coll.name == props.selected_collection:
+        for coll in collections:
+            # Add checkmark to currently selected; otherwise check
+            # that the collection has valid mesh objects
+            if coll.name == selected:
                 icon = 'CHECKMARK'
+            elif core.get_primary_object(coll):
+                icon = 'OUTLINER_COLLECTION'
+            else:
+                icon = 'ERROR'
 
             op = layout.operator("scale_render.select_collection",
                                  text=coll.name,
@@ -96,9 +151,10 @@ class SCALE_RENDER_PT_main_panel(Panel):
 
         layout.separator()
 
-        # Collection selector section
+        # Matching collections, fetched once and reused for the whole draw
         collections = core.get_filtered_collections(props.collection_prefix)
 
+        # Collection selector section
         if collections:
             box = layout.box()
             box.label(text="Collection Selector", icon='OUTLINER_COLLECTION')
@@ -119,7 +175,8 @@ class SCALE_RENDER_PT_main_panel(Panel):
             box = layout.box()
 
             # Highlight if this collection has been evaluated
-            is_evaluated = (props.selected_collection == props.last_evaluated_collection)
+            runtime = context.window_manager.scale_render_runtime
+            is_evaluated = (props.selected_collection == runtime.last_evaluated_collection)
 
             if is_evaluated:
                 box.label(text="✓ Evaluated Collection", icon='CHECKMARK')
@@ -134,7 +191,7 @@ class SCALE_RENDER_PT_main_panel(Panel):
 
             if is_evaluated:
                 # Show cached evaluation results
-                col.label(text=f"Output: {props.last_eval_res_x} × {props.last_eval_res_y} px")
+                col.label(text=f"Output: {runtime.last_eval_res_x} × {runtime.last_eval_res_y} px")
             else:
                 # Show predicted output
                 col.label(text=f"Output: {obj_info['res_x']} × {obj_info['res_y']} px (predicted)")
@@ -168,7 +225,6 @@ class SCALE_RENDER_PT_main_panel(Panel):
         row.operator("scale_render.render_all", icon='RENDER_ANIMATION')
 
         # Collection count with warning if none found
-        collections = core.get_filtered_collections(props.collection_prefix)
         layout.label(text=f"{len(collections)} collections match prefix")
 
         if len(collections) == 0 and props.collection_prefix != "":
@@ -195,13 +251,29 @@ class SCALE_RENDER_PT_main_panel(Panel):
         if not target_collection:
             return None
 
-        # Check collection has mesh objects
-        obj = core.get_primary_object(target_collection)
-        if not obj:
+        # Mid-drag on scale or padding: keep showing this collection's last
+        # info, without even looking up its bounds, and queue a redraw to
+        # catch up once the edits settle
+        cached_key = _info_cache[0]
+        if (cached_key is not None and cached_key[0] == target_collection.name
+                and time.monotonic() - _framing_changed_at < REDRAW_INTERVAL):
+            request_redraw(context.area)
+            return _info_cache[1]
+
+        # Calculate collection info (handles multiple meshes), served from
+        # core's bounds cache; None means the collection has no mesh objects
+        bounds = core.get_cached_collection_bounds(target_collection, core.get_mm_per_bu(context.scene))
+
+        if bounds is None:
             return None
 
-        # Calculate collection info (handles multiple meshes)
-        width, height, depth = core.get_collection_dimensions(target_collection)
+        # The cache hands back the same bounds object until the geometry
+        # changes, so an unchanged key means the info below is unchanged too
+        key = (target_collection.name, bounds, props.scale_factor, props.padding_px)
+        if _info_cache[0] == key:
+            return _info_cache[1]
+
+        width, height, depth = bounds.width_mm, bounds.height_mm, bounds.depth_mm
         res_x, res_y = core.calculate_resolution(
             width, height,
             props.scale_factor,
@@ -211,19 +283,18 @@ class SCALE_RENDER_PT_main_panel(Panel):
         location, _ = core.calculate_camera_position(
             target_collection,
             props.scale_factor,
-            props.padding_px
+            props.padding_px,
+            bounds=bounds,
+            resolution=(res_x, res_y)
         )
-        center = core.get_collection_center(target_collection)
-
-        if center is None:
-            return None
+        center = bounds.center
 
         cam_dist = (location - center).length
 
-        # Get count of mesh objects in collection
-        mesh_count = len([o for o in target_collection.objects if o.type == 'MESH' and not o.name.startswith('_')])
+        # Count of mesh objects in collection (same filter as the bounds)
+        mesh_count = len(bounds.mesh_objects)
 
-        return {
+        info = {
             'collection': target_collection.name,
             'object': f"{mesh_count} mesh{'es' if mesh_count != 1 else ''}",
             'width': width,
@@ -234,6 +305,9 @@ class SCALE_RENDER_PT_main_panel(Panel):
             'cam_dist': cam_dist
         }
 
+        _info_cache[:] = (key, info)
+        return info
+
 
 # Registration
 classes = (
@@ -249,5 +323,10 @@ def register():
 
 
 def unregister():
+    if bpy.app.timers.is_registered(_flush_redraws):
+        bpy.app.timers.unregister(_flush_redraws)
+    _pending_redraw_areas.clear()
+    _info_cache[:] = (None, None)
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)